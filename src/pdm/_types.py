@@ -57,13 +57,17 @@ class RepositoryConfig(_RepositoryConfig):
 
     def passive_update(self, other: RepositoryConfig | None = None, **kwargs: Any) -> None:
         """An update method that prefers the existing value over the new one."""
+        # All fields live in the instance dict, so copy them directly to
+        # avoid a getattr/setattr pair per attribute.
+        self_vars = vars(self)
         if other is not None:
-            for k in other.__dataclass_fields__:
-                v = getattr(other, k)
-                if getattr(self, k) is None and v is not None:
-                    setattr(self, k, v)
+            for k, v in vars(other).items():
+                if v is not None and self_vars.get(k) is None:
+                    self_vars[k] = v
         for k, v in kwargs.items():
-            if getattr(self, k) is None and v is not None:
+            # Keyword arguments may address properties (e.g. password),
+            # so go through the normal attribute protocol.
+            if v is not None and getattr(self, k) is None:
                 setattr(self, k, v)
 
     def __rich__(self) -> str:
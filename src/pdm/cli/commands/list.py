@@ -136,7 +136,7 @@ class Command(BaseCommand):
         # Set up `--include` and `--exclude` dep groups.
         # Include everything by default (*) then exclude after.
         # Check to make sure that only valid dep group names are given.
-        valid_groups = {*list(project.iter_groups()), SUBDEP_GROUP_LABEL}
+        valid_groups = {*project.iter_groups(), SUBDEP_GROUP_LABEL}
         include = set(parse_comma_separated_string(options.include, lowercase=False, asterisk_values=valid_groups))
         if not all(g in valid_groups for g in include):
             raise PdmUsageError(f"--include groups must be selected from: {valid_groups}")
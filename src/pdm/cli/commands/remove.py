@@ -83,7 +83,7 @@ class Command(BaseCommand):
 
         from pdm.cli.actions import do_lock, do_sync
         from pdm.cli.utils import check_project_file
-        from pdm.models.requirements import parse_requirement
+        from pdm.models.requirements import parse_line, parse_requirement
         from pdm.utils import cd
 
         hooks = hooks or HookManager(project)
@@ -99,12 +99,20 @@ class Command(BaseCommand):
             f"{'dev-' if selection.dev else ''}dependencies: " + ", ".join(f"[req]{name}[/]" for name in packages)
         )
         with cd(project.root):
+            # Parse each line once and mark removals in a bitmap, instead of
+            # re-parsing the whole array for every package being removed.
+            keys = [parse_line(r.strip()).key for r in deps]
+            removed = bytearray(len(deps))
             for name in packages:
-                req = parse_requirement(name)
-                matched_indexes = sorted((i for i, r in enumerate(deps) if req.matches(r)), reverse=True)
-                if not matched_indexes:
+                req_key = parse_requirement(name).key
+                matched = False
+                for i, key in enumerate(keys):
+                    if key == req_key and not removed[i]:
+                        removed[i] = matched = True
+                if not matched:
                     raise ProjectError(f"[req]{name}[/] does not exist in [primary]{group}[/] dependencies.")
-                for i in matched_indexes:
+            for i in range(len(removed) - 1, -1, -1):
+                if removed[i]:
                     del deps[i]
         setter(cast(Array, deps).multiline(True))
 
@@ -56,11 +56,11 @@ class GroupSelection:
         return self.default and self.dev is None and not self.groups
 
     def all(self) -> list[str] | None:
-        project_groups = list(self.project.iter_groups())
         if self.is_unset:
             if self.project.lockfile.exists():
                 groups = self.project.lockfile.groups
                 if groups:
+                    project_groups = self.project.iter_groups()
                     groups = [g for g in groups if g in project_groups]
                 return groups
         return list(self)
@@ -71,8 +71,8 @@ class GroupSelection:
         if self.is_unset:
             # Default case, return what is in the lock file
             locked_groups = self.project.lockfile.groups
-            project_groups = list(self.project.iter_groups())
             if locked_groups:
+                project_groups = self.project.iter_groups()
                 return [g for g in locked_groups if g in project_groups]
         default, dev, groups = self.default, self.dev, self.groups
         if dev is None:  # --prod is not set, include dev-dependencies
@@ -91,7 +91,8 @@ class GroupSelection:
             groups_set.update(optional_groups)
             groups_set -= set(self.excluded_groups)
 
-        invalid_groups = groups_set - set(project.iter_groups())
+        # iter_groups() is exactly the union of these, no need to recompute it
+        invalid_groups = groups_set - ({"default"} | optional_groups | dev_groups)
         if invalid_groups:
             project.core.ui.echo(
                 "[d]Ignoring non-existing groups: [success]" f"{', '.join(invalid_groups)}[/]",
@@ -110,8 +111,12 @@ class GroupSelection:
         if extra_groups:
             raise PdmUsageError(f"Requested groups not in lockfile: {','.join(extra_groups)}")
 
+    @cached_property
+    def _translated_group_set(self) -> frozenset[str]:
+        return frozenset(self._translated_groups)
+
     def __iter__(self) -> Iterator[str]:
         return iter(self._translated_groups)
 
     def __contains__(self, group: str) -> bool:
-        return group in self._translated_groups
+        return group in self._translated_group_set
@@ -16,7 +16,7 @@ from pdm.models.candidates import Candidate
 from pdm.models.requirements import (
     Requirement,
     filter_requirements_with_extras,
-    parse_requirement,
+    parse_line,
 )
 from pdm.models.search import SearchResultParser
 from pdm.models.specifiers import PySpecSet
@@ -107,10 +107,7 @@ class BaseRepository:
             )
             reqs.append(self_req)
         for line in requirements:
-            if line.startswith("-e "):
-                reqs.append(parse_requirement(line[3:], True))
-            else:
-                reqs.append(parse_requirement(line))
+            reqs.append(parse_line(line))
         # Store the metadata on the candidate for caching
         candidate.requires_python = requires_python
         candidate.summary = summary
@@ -488,13 +485,16 @@ class LockedRepository(BaseRepository):
         static_urls = FLAG_STATIC_URLS in self.environment.project.lockfile.strategy
         with cd(root):
             for package in lockfile.get("package", []):
-                version = package.get("version")
-                if version:
-                    package["version"] = f"=={version}"
-                package_name = package.pop("name")
+                package_name = package["name"]
+                # Don't mutate the package table, it may be a shared cached copy.
                 req_dict = {
-                    k: v for k, v in package.items() if k not in ("dependencies", "requires_python", "summary", "files")
+                    k: v
+                    for k, v in package.items()
+                    if k not in ("name", "dependencies", "requires_python", "summary", "files")
                 }
+                version = package.get("version")
+                if version:
+                    req_dict["version"] = f"=={version}"
                 req = Requirement.from_req_dict(package_name, req_dict)
                 if req.is_file_or_url and req.path and not req.url:  # type: ignore[attr-defined]
                     req.url = path_to_url(posixpath.join(root, req.path))  # type: ignore[attr-defined]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import dataclasses
 import functools
 import inspect
@@ -70,6 +71,12 @@ def _get_random_key(req: Requirement) -> str:
     return f":empty:{secrets.token_urlsafe(8)}"
 
 
+@functools.lru_cache(maxsize=None)
+def _requirement_init_params(cls: type) -> frozenset[str]:
+    # inspect.signature is expensive and the result is static per class
+    return frozenset(inspect.signature(cls).parameters)
+
+
 @dataclasses.dataclass(eq=False)
 class Requirement:
     """Base class of a package requirement.
@@ -94,7 +101,7 @@ class Requirement:
 
     @property
     def key(self) -> str | None:
-        return self.project_name.lower() if self.project_name else None
+        return normalize_name(self.name) if self.name else None
 
     @property
     def is_pinned(self) -> bool:
@@ -144,7 +151,7 @@ class Requirement:
             kwargs["extras"] = tuple(e.strip() for e in kwargs["extras"][1:-1].split(","))
         version = kwargs.pop("version", "")
         kwargs["specifier"] = get_specifier(version)
-        return cls(**{k: v for k, v in kwargs.items() if k in inspect.signature(cls).parameters})
+        return cls(**{k: v for k, v in kwargs.items() if k in _requirement_init_params(cls)})
 
     @classmethod
     def from_dist(cls, dist: Distribution) -> Requirement:
@@ -200,10 +207,7 @@ class Requirement:
         """Return whether the passed in PEP 508 string
         is the same requirement as this one.
         """
-        if line.strip().startswith("-e "):
-            req = parse_requirement(line.split("-e ", 1)[-1], True)
-        else:
-            req = parse_requirement(line, False)
+        req = parse_line(line.strip())
         return self.key == req.key
 
     @classmethod
@@ -506,3 +510,32 @@ def parse_requirement(line: str, editable: bool = False) -> Requirement:
         else:
             raise RequirementError(f"{line}: Editable requirement is only supported for VCS link or local directory.")
     return r
+
+
+_parsed_lines: dict[str, Requirement] = {}
+_PARSE_CACHE_SIZE = 2048
+
+
+def parse_line(line: str) -> Requirement:
+    """Parse a dependency line as it appears in pyproject.toml or package
+    metadata, with an ``-e`` prefix marking an editable requirement.
+
+    Parsed named requirements are cached so that the same line repeated
+    across groups or candidate versions is only parsed once; each caller
+    gets its own shallow copy to mutate.
+    """
+    if line.startswith("-e "):
+        return parse_requirement(line[3:].strip(), True)
+    cached = _parsed_lines.get(line)
+    if cached is None:
+        req = parse_requirement(line)
+        # Path requirements resolve against the current directory at parse
+        # time, so only cwd-independent named requirements are cached.
+        if not req.is_named:
+            return req
+        if len(_parsed_lines) >= _PARSE_CACHE_SIZE:
+            _parsed_lines.clear()
+        _parsed_lines[line] = cached = req
+    req = copy.copy(cached)
+    req.groups = list(cached.groups)
+    return req
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import contextlib
+import copy
 import hashlib
-import operator
 import os
 import re
 import shutil
 import sys
-from functools import cached_property, reduce
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, cast
 
@@ -16,12 +16,13 @@ from tomlkit.items import Array
 
 from pdm import termui
 from pdm._types import RepositoryConfig
-from pdm.exceptions import NoPythonVersion, PdmUsageError, ProjectError
+from pdm.compat import tomllib
+from pdm.exceptions import NoPythonVersion, PdmUsageError, ProjectError, RequirementError
 from pdm.models.backends import DEFAULT_BACKEND, BuildBackend, get_backend_by_spec
 from pdm.models.caches import PackageCache
 from pdm.models.python import PythonInfo
 from pdm.models.repositories import BaseRepository, LockedRepository
-from pdm.models.requirements import Requirement, parse_requirement, strip_extras
+from pdm.models.requirements import Requirement, parse_line, parse_requirement, strip_extras
 from pdm.models.specifiers import PySpecSet
 from pdm.project.config import Config, ensure_boolean
 from pdm.project.lockfile import Lockfile
@@ -51,6 +52,59 @@ if TYPE_CHECKING:
 
 
 PYENV_ROOT = os.path.expanduser(os.getenv("PYENV_ROOT", "~/.pyenv"))
+_VERSION_SPEC_RE = re.compile(r"\d+(?:\.\d+)*")
+
+
+def _maybe_path_requirement(line: str) -> bool:
+    """Whether a requirement line may reference a local path.
+
+    Over-approximates on purpose: false positives only cost a chdir,
+    while a miss would resolve a relative path against the wrong cwd.
+    """
+    return (
+        "/" in line
+        or "\\" in line
+        or line.startswith((".", "-e ", "file:"))
+        or line.endswith((".whl", ".zip", ".tar.gz", ".tar.bz2"))
+    )
+
+
+@lru_cache(maxsize=None)
+def _pyenv_shims(pyenv_root: str) -> frozenset[str]:
+    """List the pyenv shims directory once per root for this process.
+
+    Keyed on the root value so a monkeypatched PYENV_ROOT gets its own entry.
+    """
+    try:
+        return frozenset(os.listdir(os.path.join(pyenv_root, "shims")))
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=None)
+def _requires_python_hash(requires_python: str) -> str:
+    """Fingerprint a requires-python string for cache file names."""
+    return hashlib.sha1(requires_python.encode()).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _read_saved_python_file(path: str, mtime_ns: int) -> str:
+    """Read a .pdm-python file, keyed on mtime so re-reads hit the cache."""
+    return Path(path).read_text("utf-8").strip()
+
+
+@lru_cache(maxsize=None)
+def _best_installable_python(requires_python: str) -> str | None:
+    """Pick the best installable CPython version matching the requires-python.
+
+    The candidate table is a constant of the pbs_installer release, so the
+    result only depends on the requires-python string.
+    """
+    from pbs_installer._versions import PYTHON_VERSIONS
+
+    spec = PySpecSet(requires_python)
+    best_match = next((v for v in PYTHON_VERSIONS if f"{v.major}.{v.minor}.{v.micro}" in spec), None)
+    return str(best_match) if best_match is not None else None
 
 
 class Project:
@@ -66,6 +120,26 @@ class Project:
     PYPROJECT_FILENAME = "pyproject.toml"
     LOCKFILE_FILENAME = "pdm.lock"
     DEPENDENCIES_RE = re.compile(r"(?:(.+?)-)?dependencies")
+    # Known attributes get slot storage; __dict__ is kept for cached_property
+    # and for plugins that attach extra state.
+    __slots__ = (
+        "_lockfile",
+        "_environment",
+        "_python",
+        "_cache_dir",
+        "_dependency_cache",
+        "_python_requires_cache",
+        "_pdm_python_file",
+        "_legacy_pdm_toml",
+        "_python_finders",
+        "core",
+        "global_config",
+        "root",
+        "is_global",
+        "enable_write_lockfile",
+        "__dict__",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -80,6 +154,11 @@ class Project:
         self._environment: BaseEnvironment | None = None
         self._python: PythonInfo | None = None
         self._cache_dir: Path | None = None
+        # Parsed requirements of each group, keyed by the raw dependency lines
+        # so that in-place edits of the pyproject data invalidate naturally.
+        self._dependency_cache: dict[tuple[str, bool, tuple[str, ...]], list[Requirement]] = {}
+        self._python_finders: dict[tuple[bool, tuple[str, ...], str], Finder] = {}
+        self._python_requires_cache: tuple[str, PySpecSet] | None = None
         self.core = core
 
         if global_config is None:
@@ -101,6 +180,9 @@ class Project:
                 self.core.ui.info("Project is not found, fallback to the global project")
 
         self.root: Path = Path(root_path or "").absolute()
+        # Frequently probed files, built once instead of per access
+        self._pdm_python_file = self.root / ".pdm-python"
+        self._legacy_pdm_toml = self.root / ".pdm.toml"
         self.is_global = is_global
         self.enable_write_lockfile = os.getenv("PDM_FROZEN_LOCKFILE", os.getenv("PDM_NO_LOCK", "0")).lower() not in (
             "1",
@@ -140,8 +222,8 @@ class Project:
         """Read-and-writable configuration dict for project settings"""
         config = Config(self.root / "pdm.toml")
         # TODO: for backward compatibility, remove this in the future
-        if self.root.joinpath(".pdm.toml").exists():
-            legacy_config = Config(self.root / ".pdm.toml").self_data
+        if self._legacy_pdm_toml.exists():
+            legacy_config = Config(self._legacy_pdm_toml).self_data
             config.update((k, v) for k, v in legacy_config.items() if k != "python.path")
         return config
 
@@ -172,12 +254,14 @@ class Project:
     def _saved_python(self) -> str | None:
         if os.getenv("PDM_PYTHON"):
             return os.getenv("PDM_PYTHON")
-        with contextlib.suppress(FileNotFoundError):
-            return self.root.joinpath(".pdm-python").read_text("utf-8").strip()
+        with contextlib.suppress(OSError):
+            mtime_ns = self._pdm_python_file.stat().st_mtime_ns
+            return _read_saved_python_file(str(self._pdm_python_file), mtime_ns)
         with contextlib.suppress(FileNotFoundError):
             # TODO: remove this in the future
-            with self.root.joinpath(".pdm.toml").open("rb") as fp:
-                data = tomlkit.load(fp)
+            with self._legacy_pdm_toml.open("rb") as fp:
+                # Read-only access, no need for a style-preserving parser
+                data = tomllib.load(fp)
                 if data.get("python", {}).get("path"):
                     return data["python"]["path"]
         return None
@@ -185,7 +269,7 @@ class Project:
     @_saved_python.setter
     def _saved_python(self, value: str | None) -> None:
         self.root.mkdir(parents=True, exist_ok=True)
-        python_file = self.root.joinpath(".pdm-python")
+        python_file = self._pdm_python_file
         if value is None:
             with contextlib.suppress(FileNotFoundError):
                 python_file.unlink()
@@ -197,19 +281,26 @@ class Project:
         from pdm.cli.commands.venv.utils import iter_venvs
         from pdm.models.venv import get_venv_python
 
+        python_requires = self.python_requires
+        environ = os.environ
+        ignore_active_venv = ensure_boolean(environ.get("PDM_IGNORE_ACTIVE_VENV"))
+        venv_in_env = environ.get("VIRTUAL_ENV") or environ.get("CONDA_PREFIX")
+
         def match_version(python: PythonInfo) -> bool:
-            return python.valid and self.python_requires.contains(python.version, True)
+            return python.valid and python_requires.contains(python.version, True)
 
         def note(message: str) -> None:
             if not self.is_global:
                 self.core.ui.info(message)
 
         def is_active_venv(python: PythonInfo) -> bool:
-            if not (venv := os.getenv("VIRTUAL_ENV", os.getenv("CONDA_PREFIX"))):
+            if not venv_in_env:
                 return False
-            return is_path_relative_to(python.executable, venv)
+            return is_path_relative_to(python.executable, venv_in_env)
 
         config = self.config
+        use_venv: bool = config["python.use_venv"]
+        pypackages = self.root / "__pypackages__"
         saved_path = self._saved_python
         if saved_path and not os.getenv("PDM_IGNORE_SAVED_PYTHON"):
             python = PythonInfo.from_path(saved_path)
@@ -222,10 +313,7 @@ class Project:
                 )
             self._saved_python = None  # Clear the saved path if it doesn't match
 
-        if config.get("python.use_venv") and not self.is_global:
-            # Resolve virtual environments from env-vars
-            ignore_active_venv = ensure_boolean(os.getenv("PDM_IGNORE_ACTIVE_VENV"))
-            venv_in_env = os.getenv("VIRTUAL_ENV", os.getenv("CONDA_PREFIX"))
+        if use_venv and not self.is_global:
             # We don't auto reuse conda's base env since it may cause breakage when removing packages.
             if not ignore_active_venv and venv_in_env and not is_conda_base():
                 python = PythonInfo.from_path(get_venv_python(Path(venv_in_env)))
@@ -243,7 +331,7 @@ class Project:
                     self.python = python
                     return python
 
-            if not self.root.joinpath("__pypackages__").exists():
+            if not pypackages.exists():
                 self.core.ui.warn(
                     f"Project requires a python version of {self.python_requires}, "
                     f"The virtualenv is being created for you as it cannot be matched to the right version."
@@ -253,7 +341,8 @@ class Project:
                 self.python = PythonInfo.from_path(get_venv_python(venv_path))
                 return self.python
 
-        if self.root.joinpath("__pypackages__").exists() or not config["python.use_venv"] or self.is_global:
+        # Check the cheap conditions first; the __pypackages__ probe is a stat call
+        if not use_venv or self.is_global or pypackages.exists():
             for py_version in self.iter_interpreters(filter_func=match_version):
                 note("[success]__pypackages__[/] is detected, using the PEP 582 mode")
                 self.python = py_version
@@ -282,13 +371,14 @@ class Project:
     def _create_virtualenv(self, python: str | None = None) -> Path:
         from pdm.cli.commands.venv.backends import BACKENDS
 
-        backend: str = self.config["venv.backend"]
+        config = self.config
+        backend: str = config["venv.backend"]
         venv_backend = BACKENDS[backend](self, python)
         path = venv_backend.create(
             force=True,
-            in_project=self.config["venv.in_project"],
-            prompt=self.config["venv.prompt"],
-            with_pip=self.config["venv.with_pip"],
+            in_project=config["venv.in_project"],
+            prompt=config["venv.prompt"],
+            with_pip=config["venv.with_pip"],
         )
         self.core.ui.echo(f"Virtualenv is created successfully at [success]{path}[/]", err=True)
         return path
@@ -305,13 +395,19 @@ class Project:
 
     @property
     def python_requires(self) -> PySpecSet:
-        return PySpecSet(self.pyproject.metadata.get("requires-python", ""))
+        requires = self.pyproject.metadata.get("requires-python", "")
+        cached = self._python_requires_cache
+        if cached is None or cached[0] != requires:
+            # Key the cache on the raw specifier so edits invalidate naturally
+            self._python_requires_cache = cached = (requires, PySpecSet(requires))
+        return cached[1]
 
     def get_dependencies(self, group: str | None = None) -> dict[str, Requirement]:
-        metadata = self.pyproject.metadata
+        pyproject = self.pyproject
+        metadata = pyproject.metadata
         group = group or "default"
         optional_dependencies = metadata.get("optional-dependencies", {})
-        dev_dependencies = self.pyproject.settings.get("dev-dependencies", {})
+        dev_dependencies = pyproject.settings.get("dev-dependencies", {})
         in_metadata = group == "default" or group in optional_dependencies
         if group == "default":
             deps = metadata.get("dependencies", [])
@@ -327,31 +423,50 @@ class Project:
                 deps = dev_dependencies[group]
             else:
                 raise PdmUsageError(f"Non-exist group {group}")
-        result = {}
-        with cd(self.root):
+        cache_key = (group, in_metadata, tuple(deps))
+        parsed = self._dependency_cache.get(cache_key)
+        if parsed is None:
+            parsed = []
+            # Bind the hot callables once to cut per-line overhead
+            parse = parse_requirement
+            add_parsed = parsed.append
+            # Only pay the chdir pair when a line may resolve a relative path
+            in_root = cd(self.root) if any(map(_maybe_path_requirement, deps)) else contextlib.nullcontext()
+            with in_root:
+                for line in deps:
+                    if line.startswith("-e "):
+                        if in_metadata:
+                            continue  # warned below, also on cache hits
+                        add_parsed(parse(line[3:].strip(), True))
+                    else:
+                        add_parsed(parse(line))
+            self._dependency_cache[cache_key] = parsed
+        if in_metadata:
             for line in deps:
                 if line.startswith("-e "):
-                    if in_metadata:
-                        self.core.ui.warn(
-                            f"Skipping editable dependency [b]{line}[/] in the"
-                            r" [success]\[project][/] table. Please move it to the "
-                            r"[success]\[tool.pdm.dev-dependencies][/] table"
-                        )
-                        continue
-                    req = parse_requirement(line[3:].strip(), True)
-                else:
-                    req = parse_requirement(line)
-                req.groups = [group]
-                # make editable packages behind normal ones to override correctly.
-                result[req.identify()] = req
+                    self.core.ui.warn(
+                        f"Skipping editable dependency [b]{line}[/] in the"
+                        r" [success]\[project][/] table. Please move it to the "
+                        r"[success]\[tool.pdm.dev-dependencies][/] table"
+                    )
+        result = {}
+        make_copy = copy.copy
+        for cached_req in parsed:
+            req = make_copy(cached_req)
+            req.groups = [group]
+            # make editable packages behind normal ones to override correctly.
+            result[req.identify()] = req
         return result
 
-    def iter_groups(self) -> Iterable[str]:
+    def iter_groups(self) -> set[str]:
         groups = {"default"}
-        if self.pyproject.metadata.get("optional-dependencies"):
-            groups.update(self.pyproject.metadata["optional-dependencies"].keys())
-        if self.pyproject.settings.get("dev-dependencies"):
-            groups.update(self.pyproject.settings["dev-dependencies"].keys())
+        for source in (
+            self.pyproject.metadata.get("optional-dependencies"),
+            self.pyproject.settings.get("dev-dependencies"),
+        ):
+            if source:
+                # iterating the mapping yields the group names directly
+                groups.update(source)
         return groups
 
     @property
@@ -361,16 +476,17 @@ class Project:
     @property
     def default_source(self) -> RepositoryConfig:
         """Get the default source from the pypi setting"""
+        config = self.config
         return RepositoryConfig(
             config_prefix="pypi",
             name="pypi",
-            url=self.config["pypi.url"],
-            verify_ssl=self.config["pypi.verify_ssl"],
-            username=self.config.get("pypi.username"),
-            password=self.config.get("pypi.password"),
-            ca_certs=self.config.get("pypi.ca_certs"),
-            client_cert=self.config.get("pypi.client_cert"),
-            client_key=self.config.get("pypi.client_key"),
+            url=config["pypi.url"],
+            verify_ssl=config["pypi.verify_ssl"],
+            username=config.get("pypi.username"),
+            password=config.get("pypi.password"),
+            ca_certs=config.get("pypi.ca_certs"),
+            client_cert=config.get("pypi.client_cert"),
+            client_key=config.get("pypi.client_key"),
         )
 
     @property
@@ -395,10 +511,11 @@ class Project:
             merge_sources(self.project_config.iter_sources())
             merge_sources(self.global_config.iter_sources())
         sources: list[RepositoryConfig] = []
+        backend = DEFAULT_BACKEND(self.root)
         for source in result.values():
             if not source.url:
                 continue
-            source.url = DEFAULT_BACKEND(self.root).expand_line(expand_env_vars_in_auth(source.url))
+            source.url = backend.expand_line(expand_env_vars_in_auth(source.url))
             sources.append(source)
         return sources
 
@@ -414,7 +531,7 @@ class Project:
     @property
     def locked_repository(self) -> LockedRepository:
         try:
-            lockfile = self.lockfile._data.unwrap()
+            lockfile = self.lockfile.unwrap()
         except ProjectError:
             lockfile = {}
 
@@ -537,6 +654,21 @@ class Project:
         and the second value is a callable to set the dependencies array back.
         """
 
+        metadata, settings = self.pyproject.metadata, self.pyproject.settings
+        if group == "default":
+
+            def update_default_dependencies(deps: list[str]) -> None:
+                metadata["dependencies"] = deps
+
+            return metadata.get("dependencies", tomlkit.array()), update_default_dependencies
+
+        def update_optional_dependencies(deps: list[str]) -> None:
+            metadata.setdefault("optional-dependencies", {})[group] = deps
+
+        optional_dependencies = metadata.get("optional-dependencies", {})
+        if group in optional_dependencies:
+            return optional_dependencies[group], update_optional_dependencies
+
         def update_dev_dependencies(deps: list[str]) -> None:
             from tomlkit.container import OutOfOrderTableProxy
 
@@ -548,21 +680,13 @@ class Project:
                 del self.pyproject._data["tool"]["pdm"]
                 self.pyproject._data["tool"]["pdm"] = settings
 
-        metadata, settings = self.pyproject.metadata, self.pyproject.settings
-        if group == "default":
-            return metadata.get("dependencies", tomlkit.array()), lambda x: metadata.__setitem__("dependencies", x)
-        deps_setter = [
-            (
-                metadata.get("optional-dependencies", {}),
-                lambda x: metadata.setdefault("optional-dependencies", {}).__setitem__(group, x),
-            ),
-            (settings.get("dev-dependencies", {}), update_dev_dependencies),
-        ]
-        for deps, setter in deps_setter:
-            if group in deps:
-                return deps[group], setter
+        dev_dependencies = settings.get("dev-dependencies", {})
+        if group in dev_dependencies:
+            return dev_dependencies[group], update_dev_dependencies
         # If not found, return an empty list and a setter to add the group
-        return tomlkit.array(), deps_setter[int(dev)][1]
+        if dev:
+            return tomlkit.array(), update_dev_dependencies
+        return tomlkit.array(), update_optional_dependencies
 
     def add_dependencies(
         self,
@@ -573,16 +697,33 @@ class Project:
         write: bool = True,
     ) -> None:
         deps, setter = self.use_pyproject_dependencies(to_group, dev)
-        for _, dep in requirements.items():
-            matched_index = next(
-                (i for i, r in enumerate(deps) if dep.matches(r)),
-                None,
-            )
-            req = dep.as_line()
-            if matched_index is None:
-                deps.append(req)
-            else:
-                deps[matched_index] = req
+        if requirements:
+            # Index existing lines by requirement key so each new requirement
+            # costs an O(1) lookup instead of a matches() scan over the array.
+            # Lines are parsed lazily: we only advance through the array until
+            # the key is found, so matched entries don't force a full parse.
+            original_len = len(deps)
+            index_by_key: dict[str | None, int] = {}
+            scanned = 0
+
+            def index_of(key: str | None) -> int | None:
+                nonlocal scanned
+                matched = index_by_key.get(key)
+                while matched is None and scanned < original_len:
+                    with contextlib.suppress(RequirementError):
+                        index_by_key.setdefault(parse_line(deps[scanned].strip()).key, scanned)
+                    scanned += 1
+                    matched = index_by_key.get(key)
+                return matched
+
+            for dep in requirements.values():
+                req = dep.as_line()
+                matched_index = index_of(dep.key)
+                if matched_index is None:
+                    deps.append(req)
+                    index_by_key.setdefault(dep.key, len(deps) - 1)
+                else:
+                    deps[matched_index] = req
         setter(cast(Array, deps).multiline(True))
         if write:
             self.pyproject.write(show_message)
@@ -629,7 +770,7 @@ class Project:
     def make_candidate_info_cache(self) -> CandidateInfoCache:
         from pdm.models.caches import CandidateInfoCache
 
-        python_hash = hashlib.sha1(str(self.environment.python_requires).encode()).hexdigest()
+        python_hash = _requires_python_hash(str(self.environment.python_requires))
         file_name = f"package_meta_{python_hash}.json"
         return CandidateInfoCache(self.cache("metadata") / file_name)
 
@@ -647,10 +788,6 @@ class Project:
         """Iterate over all interpreters that matches the given specifier.
         And optionally install the interpreter if not found.
         """
-        from pbs_installer._versions import PYTHON_VERSIONS, PythonVersion
-
-        from pdm.cli.commands.python import InstallCommand
-
         found = False
         for interpreter in self.find_interpreters(python_spec, search_venv):
             if filter_func is None or filter_func(interpreter):
@@ -659,15 +796,15 @@ class Project:
         if found or self.is_global:
             return
 
-        def get_version(version: PythonVersion) -> str:
-            return f"{version.major}.{version.minor}.{version.micro}"
+        # Only needed when we fall through to installing an interpreter,
+        # keep the found-an-interpreter path free of this import.
+        from pdm.cli.commands.python import InstallCommand
 
         if not python_spec:  # handle both empty string and None
             # Get the best match meeting the requires-python
-            best_match = next((v for v in PYTHON_VERSIONS if get_version(v) in self.python_requires), None)
-            if best_match is None:
+            python_spec = _best_installable_python(str(self.python_requires))
+            if python_spec is None:
                 return
-            python_spec = str(best_match)
 
         try:
             # otherwise if no interpreter is found, try to install it
@@ -694,19 +831,20 @@ class Project:
         finder_arg: str | None = None
 
         if not python_spec:
-            if config.get("python.use_pyenv", True) and os.path.exists(PYENV_ROOT):
-                pyenv_shim = os.path.join(PYENV_ROOT, "shims", "python3")
-                if os.name == "nt":
-                    pyenv_shim += ".bat"
-                if os.path.exists(pyenv_shim):
-                    yield PythonInfo.from_path(pyenv_shim)
-                elif os.path.exists(pyenv_shim.replace("python3", "python")):
-                    yield PythonInfo.from_path(pyenv_shim.replace("python3", "python"))
+            if config.get("python.use_pyenv", True):
+                # One directory read covers the root-exists and both shim
+                # variants, instead of a stat per candidate.
+                shims = _pyenv_shims(PYENV_ROOT)
+                suffix = ".bat" if os.name == "nt" else ""
+                for shim in (f"python3{suffix}", f"python{suffix}"):
+                    if shim in shims:
+                        yield PythonInfo.from_path(os.path.join(PYENV_ROOT, "shims", shim))
+                        break
             python = shutil.which("python") or shutil.which("python3")
             if python:
                 yield PythonInfo.from_path(python)
         else:
-            if not all(c.isdigit() for c in python_spec.split(".")):
+            if not _VERSION_SPEC_RE.fullmatch(python_spec):
                 path = Path(python_spec)
                 if path.exists():
                     python = find_python_in_path(python_spec)
@@ -734,7 +872,14 @@ class Project:
 
         from pdm.cli.commands.venv.utils import VenvProvider
 
-        providers: list[str] = self.config["python.providers"]
+        config = self.config
+        # Copy so dropping "venv" below doesn't mutate the config value.
+        providers: list[str] = list(config["python.providers"])
+        install_root: str = config["python.install_root"]
+        cache_key = (bool(search_venv), tuple(providers), install_root)
+        cached = self._python_finders.get(cache_key)
+        if cached is not None:
+            return cached
         venv_pos = -1
         if not providers:
             venv_pos = 0
@@ -742,7 +887,7 @@ class Project:
             venv_pos = providers.index("venv")
             providers.remove("venv")
         old_rye_root = os.getenv("RYE_PY_ROOT")
-        os.environ["RYE_PY_ROOT"] = os.path.expanduser(self.config["python.install_root"])
+        os.environ["RYE_PY_ROOT"] = os.path.expanduser(install_root)
         try:
             finder = Finder(resolve_symlinks=True, selected_providers=providers or None)
         finally:
@@ -752,6 +897,7 @@ class Project:
                 del os.environ["RYE_PY_ROOT"]
         if search_venv and venv_pos >= 0:
             finder.add_provider(VenvProvider(self), venv_pos)
+        self._python_finders[cache_key] = finder
         return finder
 
     @property
@@ -772,10 +918,12 @@ class Project:
 
         Returns `None` if the key does not exists.
         """
-        try:
-            return reduce(operator.getitem, key.split("."), self.pyproject.settings)
-        except tomlkit.exceptions.NonExistentKey:
-            return None
+        node: Any = self.pyproject.settings
+        for part in key.split("."):
+            if not isinstance(node, Mapping) or part not in node:
+                return None
+            node = node[part]
+        return node
 
     def env_or_setting(self, var: str, key: str) -> Any:
         """
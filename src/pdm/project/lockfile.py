@@ -33,6 +33,13 @@ class Compatibility(enum.IntEnum):
 
 class Lockfile(TOMLBase):
     spec_version = parse_version("4.4.1")
+    _unwrapped: dict[str, Any] | None = None
+
+    def unwrap(self) -> dict[str, Any]:
+        """The plain-dict form of the lockfile content, cached until the data changes."""
+        if self._unwrapped is None:
+            self._unwrapped = self._data.unwrap()
+        return self._unwrapped
 
     @cached_property
     def default_strategies(self) -> set[str]:
@@ -87,6 +94,11 @@ class Lockfile(TOMLBase):
         for line in GENERATED_COMMENTS:
             self._data.append(None, tomlkit.comment(line))
         self._data.update(data)
+        self._unwrapped = None
+
+    def reload(self) -> None:
+        super().reload()
+        self._unwrapped = None
 
     def write(self, show_message: bool = True) -> None:
         super().write()
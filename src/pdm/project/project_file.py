@@ -22,6 +22,8 @@ def _remove_empty_tables(doc: dict) -> None:
 class PyProject(TOMLBase):
     """The data object representing th pyproject.toml file"""
 
+    _content_hash_cache: dict[str, str] | None = None
+
     def read(self) -> TOMLDocument:
         from pdm.formats import flit, poetry
 
@@ -37,8 +39,17 @@ class PyProject(TOMLBase):
                     break
         return data
 
+    def set_data(self, data: Mapping[str, Any]) -> None:
+        super().set_data(data)
+        self._content_hash_cache = None
+
+    def reload(self) -> None:
+        super().reload()
+        self._content_hash_cache = None
+
     def write(self, show_message: bool = True) -> None:
         """Write the TOMLDocument to the file."""
+        self._content_hash_cache = None
         _remove_empty_tables(self._data.get("project", {}))
         _remove_empty_tables(self._data.get("tool", {}).get("pdm", {}))
         super().write()
@@ -83,6 +94,11 @@ class PyProject(TOMLBase):
         """Generate a hash of the sensible content of the pyproject.toml file.
         When the hash changes, it means the project needs to be relocked.
         """
+        cache = self._content_hash_cache
+        if cache is None:
+            cache = self._content_hash_cache = {}
+        if algo in cache:
+            return cache[algo]
         dump_data = {
             "sources": self.settings.get("source", []),
             "dependencies": self.metadata.get("dependencies", []),
@@ -94,7 +110,8 @@ class PyProject(TOMLBase):
         pyproject_content = json.dumps(dump_data, sort_keys=True)
         hasher = hashlib.new(algo)
         hasher.update(pyproject_content.encode("utf-8"))
-        return hasher.hexdigest()
+        cache[algo] = hasher.hexdigest()
+        return cache[algo]
 
     @property
     def plugins(self) -> list[str]:
@@ -18,9 +18,10 @@ class TOMLBase(TOMLFile):
         self._data = self.read()
 
     def read(self) -> TOMLDocument:
-        if not self._path.exists():
+        try:
+            return super().read()
+        except FileNotFoundError:
             return tomlkit.document()
-        return super().read()
 
     def set_data(self, data: Mapping[str, Any]) -> None:
         """Set the data of the TOML file."""
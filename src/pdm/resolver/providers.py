@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import os
 from typing import TYPE_CHECKING, Callable
@@ -34,7 +35,9 @@ def get_provider(strategy: str) -> type[BaseProvider]:
     return _PROVIDER_REGISTORY[strategy]
 
 
+@functools.lru_cache(maxsize=None)
 def provider_arguments(provider: type[BaseProvider]) -> set[str]:
+    # inspect.signature is expensive and the result is static per class
     arguments: set[str] = set()
     for cls in provider.__mro__:
         if "__init__" not in cls.__dict__:
@@ -167,12 +170,14 @@ class BaseProvider(AbstractProvider):
                 req = f"{identifier}{requested}"
         return self._find_candidates(parse_requirement(req))
 
-    def _is_direct_requirement(self, requirement: Requirement) -> bool:
-        from collections import ChainMap
-
+    @functools.cached_property
+    def _direct_requirement_keys(self) -> frozenset[str]:
+        # A frozen view is enough here; the provider lives for one resolution
         project = self.repository.environment.project
-        all_dependencies = ChainMap(*project.all_dependencies.values())
-        return requirement.identify() in all_dependencies
+        return frozenset(key for deps in project.all_dependencies.values() for key in deps)
+
+    def _is_direct_requirement(self, requirement: Requirement) -> bool:
+        return requirement.identify() in self._direct_requirement_keys
 
     def _find_candidates(self, requirement: Requirement) -> Iterable[Candidate]:
         if not requirement.is_named and not isinstance(self.repository, LockedRepository):